@@ -62,11 +62,9 @@ def main():
     settings_session = session.filter_type(RecordTypes.GAME_SETTINGS)
     print(f"   Game settings records: {len(settings_session)}")
 
-    # 4. Filter by custom filter
-    print("\n4. Filtering by custom filter (head senderTag)...")
-    head_movement = movement_session.filter(
-        lambda r: r.get("senderTag") == MovementSources.HEAD
-    )
+    # 4. Filter by sender tag
+    print("\n4. Filtering by sender tag (head)...")
+    head_movement = movement_session.filter_sender(MovementSources.HEAD)
     print(f"   Head tracking records: {len(head_movement)}")
 
     # 5. Time-based filtering
@@ -10,6 +10,7 @@ from .exceptions import (
     SceneNotFoundError,
 )
 from .logs import LogSession, SceneView
+from .predicates import Eq
 from .reader import load_all_logs, load_log, read_records
 from .scene import SceneManager
 from .types import (
@@ -44,6 +45,8 @@ __all__ = [
     "LogReadError",
     "SceneNotFoundError",
     "ExtractionError",
+    # Predicates
+    "Eq",
     # Types and constants
     "LogRecord",
     "FilterFunction",
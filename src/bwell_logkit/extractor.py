@@ -5,32 +5,82 @@ Data extraction and export functionality for bWell log analysis.
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from .exceptions import ExtractionError
-from .types import LogRecord, SceneInfo
+from .types import LogRecord, RecordFields, SceneInfo
 
 if TYPE_CHECKING:
     from .logs import LogSession
 
+# Number of records flattened and written per batch in streaming CSV export
+_CSV_BATCH_SIZE = 50_000
+
+# Columns with a small set of repeated string values; stored as pandas
+# Categorical so each row holds a small integer code instead of a PyObject
+_DEFAULT_CATEGORICAL_COLUMNS = (
+    RecordFields.RECORD_TYPE,
+    RecordFields.SENDER_TAG,
+    RecordFields.SceneEntry.SCENE_NAME,
+)
+
+# Scene metadata columns appended by SceneViewExtractor, with the dtypes
+# used when the scene has no records
+_EMPTY_SCENE_COLUMNS = {
+    "scene_name": "category",
+    "scene_instance": "int64",
+    "scene_start_game_time_secs": "float64",
+    "scene_end_game_time_secs": "float64",
+    "scene_start_millis_since_epoch": "int64",
+    "scene_end_millis_since_epoch": "int64",
+    "scene_duration": "float64",
+}
+
+
+def _collect_columns(records: list[LogRecord]) -> list[str]:
+    """Collect flattened column names in first-seen order."""
+    columns: dict[str, None] = {}
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, dict):
+                for nested_key in value:
+                    columns.setdefault(f"{key}_{nested_key}", None)
+            else:
+                columns.setdefault(key, None)
+    return list(columns)
+
 
-def _flatten_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
-    """Flatten nested dictionaries in DataFrame columns."""
+def _flatten_records(records: list[LogRecord]) -> "pd.DataFrame":
+    """
+    Flatten records into column-major lists and build a DataFrame.
 
-    flattened_data = []
+    A single pass fills one list per flattened column, so no per-row
+    intermediate dicts or DataFrames are allocated; pandas wraps the lists
+    directly into typed blocks.
+    """
+    columns = _collect_columns(records)
+    n = len(records)
+    data: dict[str, list[Any]] = {col: [None] * n for col in columns}
 
-    for _, row in df.iterrows():
-        flattened_row = {}
-        for col, value in row.items():
-            # Ensure col is treated as str for dict indexing
-            col_str = str(col)
+    # Memoize flattened-name lookups so the inner loop does not rebuild and
+    # re-hash an f"{key}_{nested_key}" string for every record
+    nested_targets: dict[tuple[str, str], list[Any]] = {}
+
+    for i, record in enumerate(records):
+        for key, value in record.items():
             if isinstance(value, dict):
                 for nested_key, nested_value in value.items():
-                    flattened_row[f"{col_str}_{nested_key}"] = nested_value
+                    target = nested_targets.get((key, nested_key))
+                    if target is None:
+                        target = data[f"{key}_{nested_key}"]
+                        nested_targets[(key, nested_key)] = target
+                    target[i] = nested_value
             else:
-                flattened_row[col_str] = value
-        flattened_data.append(flattened_row)
+                data[key][i] = value
 
-    return pd.DataFrame(flattened_data)
+    return pd.DataFrame(data, copy=False)
 
 
 class LogSessionExtractor:
@@ -46,16 +96,55 @@ class LogSessionExtractor:
         """
         self._records = records
         self._metadata = metadata
+        self._df_cache: dict[tuple[bool, bool, tuple[str, ...]], pd.DataFrame] = {}
+        self._table_cache: pa.Table | None = None
+
+    def _invalidate(self) -> None:
+        """Clear cached DataFrames after records/metadata change."""
+        self._df_cache.clear()
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Export session data to a pyarrow Table.
+
+        Nested dicts become Arrow struct columns, so no flattening pass is
+        needed. The Table is cached and its columnar buffers are shared by
+        repeated exports; callers must not mutate it.
+
+        Returns:
+            pa.Table: Table containing all log records
+
+        Raises:
+            ExtractionError: If the Table cannot be built
+        """
+        if self._table_cache is None:
+            try:
+                self._table_cache = pa.Table.from_pylist(self._records)
+            except Exception as e:
+                raise ExtractionError(
+                    f"Failed to create Arrow table: {e}", "to_arrow"
+                ) from e
+        return self._table_cache
 
     def to_pandas(
-        self, flatten: bool = True, include_metadata: bool = False
+        self,
+        flatten: bool = True,
+        include_metadata: bool = False,
+        categorical_columns: "tuple[str, ...] | None" = None,
     ) -> "pd.DataFrame":
         """
         Export session data to a pandas DataFrame.
 
+        Results are cached per argument combination, so repeated calls
+        return the same DataFrame object. Callers must not mutate the
+        returned DataFrame in place.
+
         Args:
             flatten: Whether to flatten dicts into separate columns
             include_metadata: Whether to include session metadata as columns
+            categorical_columns: Columns converted to Categorical dtype
+                (default: record type, sender tag and scene name). Pass ()
+                to disable the conversion.
 
         Returns:
             pd.DataFrame: DataFrame containing all log records
@@ -67,44 +156,115 @@ class LogSessionExtractor:
         if not self._records:
             return pd.DataFrame()
 
-        try:
-            df = pd.DataFrame(self._records)
-
-            if flatten:
-                df = _flatten_dataframe(df)
-
-            if include_metadata:
-                for key, value in self._metadata.items():
-                    df[f"session_{key}"] = value
+        if categorical_columns is None:
+            categorical_columns = _DEFAULT_CATEGORICAL_COLUMNS
 
-            return df
+        cache_key = (flatten, include_metadata, categorical_columns)
+        cached = self._df_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
+        # Keep the build itself free of exception handlers; the single
+        # try here wraps one call instead of every statement of the build
+        try:
+            df = self._build_df(flatten, include_metadata, categorical_columns)
         except Exception as e:
             raise ExtractionError(
                 f"Failed to create DataFrame: {e}", "to_pandas"
             ) from e
 
+        self._df_cache[cache_key] = df
+        return df
+
+    def _build_df(
+        self,
+        flatten: bool,
+        include_metadata: bool,
+        categorical_columns: tuple[str, ...],
+    ) -> "pd.DataFrame":
+        """Build the (uncached) DataFrame for to_pandas."""
+        if flatten:
+            df = _flatten_records(self._records)
+        else:
+            df = pd.DataFrame(self._records)
+
+        for col in categorical_columns:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
+
+        if include_metadata:
+            for key, value in self._metadata.items():
+                df[f"session_{key}"] = value
+
+        return df
+
     def export_csv(self, file_path: str, **kwargs: Any) -> None:
         """
         Export session data to CSV file.
 
+        Without custom to_csv options the write goes through pyarrow's
+        multi-threaded C++ CSV writer. With options, records are flattened
+        and written in fixed-size batches via pandas, so peak memory stays
+        bounded by the batch size instead of the full session.
+
         Args:
             file_path: Path for the output CSV file
             **kwargs: Additional arguments passed to pandas.to_csv()
         """
-        df = self.to_pandas()
-        df.to_csv(file_path, index=False, **kwargs)
-
-    def export_parquet(self, file_path: str, **kwargs: Any) -> None:
+        if not self._records:
+            pd.DataFrame().to_csv(file_path, index=False, **kwargs)
+            return
+
+        if not kwargs:
+            # Expand struct columns and match the pandas layout's
+            # underscore-separated column names
+            table = self.to_arrow().flatten()
+            table = table.rename_columns(
+                [name.replace(".", "_") for name in table.column_names]
+            )
+            pacsv.write_csv(table, file_path)
+            return
+
+        # Pre-collect the full column set so every batch lines up even if
+        # later records introduce new fields.
+        columns = _collect_columns(self._records)
+
+        # Options the batching loop manages itself are popped so caller
+        # values are honored instead of colliding with ours: encoding
+        # applies to the shared handle, header only to the first batch
+        encoding = kwargs.pop("encoding", "utf-8")
+        index = kwargs.pop("index", False)
+        header = kwargs.pop("header", True)
+
+        with open(file_path, "w", newline="", encoding=encoding) as fh:
+            for start in range(0, len(self._records), _CSV_BATCH_SIZE):
+                batch = self._records[start : start + _CSV_BATCH_SIZE]
+                df = _flatten_records(batch).reindex(columns=columns)
+                df.to_csv(fh, index=index, header=header, **kwargs)
+                header = False
+
+    def export_parquet(
+        self, file_path: str, flatten: bool = False, **kwargs: Any
+    ) -> None:
         """
         Export session data to Parquet file.
 
+        By default records are written directly through pyarrow, preserving
+        nested dicts as Parquet struct columns and skipping the pandas
+        flatten pass entirely. Pass flatten=True for the flattened layout.
+
         Args:
             file_path: Path for the output Parquet file
-            **kwargs: Additional arguments passed to pandas.to_parquet()
+            flatten: Whether to flatten dicts into separate columns
+            **kwargs: Additional arguments passed to pyarrow.parquet
+                .write_table() (or pandas.to_parquet() when flatten=True)
         """
-        df = self.to_pandas()
-        df.to_parquet(file_path, index=False, **kwargs)
+        if flatten:
+            df = self.to_pandas(flatten=True)
+            df.to_parquet(file_path, index=False, **kwargs)
+            return
+
+        pq.write_table(self.to_arrow(), file_path, **kwargs)
 
 
 class SceneViewExtractor:
@@ -145,46 +305,52 @@ class SceneViewExtractor:
             ExtractionError: If pandas is not available or export fails
         """
         try:
-            # Get base DataFrame from session
-            df = self._session.to_pandas(flatten, include_metadata)
-
-            # Add scene-specific columns if requested
-            if include_scene_info:
-                if df.empty:
-                    # For empty DFs, create the columns with appropriate types
-                    scene_columns = {
-                        "scene_name": pd.Series([], dtype="object"),
-                        "scene_instance": pd.Series([], dtype="int64"),
-                        "scene_start_game_time_secs": pd.Series([], dtype="float64"),
-                        "scene_end_game_time_secs": pd.Series([], dtype="float64"),
-                        "scene_start_millis_since_epoch": pd.Series([], dtype="int64"),
-                        "scene_end_millis_since_epoch": pd.Series([], dtype="int64"),
-                        "scene_duration": pd.Series([], dtype="float64"),
-                    }
-                    for col_name, col_series in scene_columns.items():
-                        df[col_name] = col_series
-                else:
-                    df["scene_name"] = self._scene_info.name
-                    df["scene_instance"] = self._scene_info.instance
-                    df["scene_start_game_time_secs"] = (
-                        self._scene_info.start_game_time_secs
-                    )
-                    df["scene_end_game_time_secs"] = self._scene_info.end_game_time_secs
-                    df["scene_start_millis_since_epoch"] = (
-                        self._scene_info.start_millis_since_epoch
-                    )
-                    df["scene_end_millis_since_epoch"] = (
-                        self._scene_info.end_millis_since_epoch
-                    )
-                    df["scene_duration"] = self._scene_info.duration_secs
-
-            return df
-
+            return self._build_df(flatten, include_metadata, include_scene_info)
         except Exception as e:
             raise ExtractionError(
                 f"Failed to create scene DataFrame: {e}", "scene_to_pandas"
             ) from e
 
+    def _build_df(
+        self,
+        flatten: bool,
+        include_metadata: bool,
+        include_scene_info: bool,
+    ) -> "pd.DataFrame":
+        """Build the scene DataFrame for to_pandas."""
+        # Get base DataFrame from session
+        df = self._session.to_pandas(flatten, include_metadata)
+
+        # Add scene-specific columns if requested. df.assign broadcasts
+        # all columns in one pass and returns a new frame, so the
+        # session's cached DataFrame is never mutated.
+        if include_scene_info:
+            if df.empty:
+                # For empty DFs, add all typed columns in one pass rather
+                # than one BlockManager insertion per column
+                df = df.assign(
+                    **{
+                        col: pd.Series([], dtype=dtype)
+                        for col, dtype in _EMPTY_SCENE_COLUMNS.items()
+                    }
+                )
+            else:
+                info = self._scene_info
+                # scene_name is constant across the frame; a repeated
+                # single-category Categorical stores one small code per
+                # row instead of N references to the string
+                df = df.assign(
+                    scene_name=pd.Categorical([info.name]).repeat(len(df)),
+                    scene_instance=info.instance,
+                    scene_start_game_time_secs=info.start_game_time_secs,
+                    scene_end_game_time_secs=info.end_game_time_secs,
+                    scene_start_millis_since_epoch=info.start_millis_since_epoch,
+                    scene_end_millis_since_epoch=info.end_millis_since_epoch,
+                    scene_duration=info.duration_secs,
+                )
+
+        return df
+
     def export_csv(self, file_path: str, **kwargs: Any) -> None:
         """Export scene data to CSV file with scene metadata."""
         df = self.to_pandas()
@@ -3,18 +3,31 @@ Core LogSession and SceneView classes for bWell log analysis.
 """
 
 import bisect
-import copy
+import heapq
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 from .exceptions import SceneNotFoundError
 from .extractor import LogSessionExtractor, SceneViewExtractor
 from .scene import SceneManager
-from .types import FilterFunction, LogRecord, RecordFields, SceneInfo
+from .types import FilterFunction, LogRecord, RecordFields, RecordTypes, SceneInfo
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
+
+# Field/type names used in per-record loops, bound once at import time so
+# the loops do plain global loads instead of chained attribute lookups
+_RECORD_TYPE = RecordFields.RECORD_TYPE
+_GAME_TIME_SECS = RecordFields.GAME_TIME_SECS
+_MILLIS_SINCE_EPOCH = RecordFields.MILLIS_SINCE_EPOCH
+_SENDER_TAG = RecordFields.SENDER_TAG
+_RECORD_ID = RecordFields.ID
+_SCENE_NAME = RecordFields.SceneEntry.SCENE_NAME
+_SCENE_ENTRY = RecordTypes.SCENE_ENTRY
 
 
 def _freeze(obj: Any) -> Any:
@@ -30,26 +43,113 @@ def _freeze(obj: Any) -> Any:
         return obj
 
 
+def _record_key(record: LogRecord) -> Any:
+    """Build a hashable dedup key for a record (ID field excluded)."""
+    tmp = dict(record)
+    tmp.pop(_RECORD_ID, None)
+
+    try:
+        # Canonical C-level serialization is far cheaper than recursively
+        # freezing nested containers in Python
+        return orjson.dumps(tmp, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        # Fall back for values orjson cannot serialize
+        return _freeze(tmp)
+
+
 def _clean_records(records: list[LogRecord]) -> list[LogRecord]:
-    """Clean and deduplicate records."""
-    seen = set()
-    cleaned = []
+    """Clean and deduplicate records.
+
+    Duplicates are detected in two tiers: a cheap (timestamp, epoch, type)
+    tuple prefilters first, and the full serialized record key is only
+    computed when two records collide on that tuple. Most records are
+    unique on the cheap tuple, so the expensive serialization usually runs
+    only for actual duplicates.
+    """
+    cleaned: list[LogRecord] = []
+    # Cheap key -> full keys of kept records; None means a single record
+    # was kept and its full key has not been needed yet
+    seen: dict[tuple[Any, Any, Any], set[Any] | None] = {}
+    # Cheap key -> that single kept record, so its full key can be
+    # computed lazily on the first collision
+    pending: dict[tuple[Any, Any, Any], LogRecord] = {}
 
     for rec in records:
-        # Make a shallow copy, drop the ID
-        tmp = dict(rec)
-        tmp.pop(RecordFields.ID, None)
+        cheap_key = (
+            rec.get(_GAME_TIME_SECS),
+            rec.get(_MILLIS_SINCE_EPOCH),
+            rec.get(_RECORD_TYPE),
+        )
+
+        if cheap_key not in seen:
+            seen[cheap_key] = None
+            pending[cheap_key] = rec
+            cleaned.append(rec)
+            continue
 
-        key = _freeze(tmp)
+        full_keys = seen[cheap_key]
+        if full_keys is None:
+            full_keys = {_record_key(pending.pop(cheap_key))}
+            seen[cheap_key] = full_keys
 
-        if key not in seen:
-            seen.add(key)
+        key = _record_key(rec)
+        if key not in full_keys:
+            full_keys.add(key)
             cleaned.append(rec)
 
-    cleaned.sort(key=lambda r: r.get(RecordFields.GAME_TIME_SECS, 0.0))
+    cleaned.sort(key=lambda r: r.get(_GAME_TIME_SECS, 0.0))
     return cleaned
 
 
+def _compute_stats(records: Iterable[LogRecord]) -> dict[str, Any]:
+    """Single-pass stats over any record iterable (no scenes/metadata)."""
+    total = 0
+    type_counts: dict[str, int] = defaultdict(int)
+    scene_counts: dict[str, int] = defaultdict(int)
+    gt_min = gt_max = None
+    ep_min = ep_max = None
+
+    for record in records:
+        total += 1
+        record_type = record.get(_RECORD_TYPE, "unknown")
+        type_counts[record_type] += 1
+
+        if record_type == _SCENE_ENTRY:
+            scene_name = record.get(_SCENE_NAME)
+            if scene_name:
+                scene_counts[scene_name] += 1
+
+        gt = record.get(_GAME_TIME_SECS)
+        if gt is not None:
+            if gt_min is None or gt < gt_min:
+                gt_min = gt
+            if gt_max is None or gt > gt_max:
+                gt_max = gt
+
+        ep = record.get(_MILLIS_SINCE_EPOCH)
+        if ep is not None:
+            if ep_min is None or ep < ep_min:
+                ep_min = ep
+            if ep_max is None or ep > ep_max:
+                ep_max = ep
+
+    game_time_range = None
+    if gt_min is not None:
+        game_time_range = {"start": gt_min, "end": gt_max}
+
+    millis_since_epoch_range = None
+    if ep_min is not None:
+        millis_since_epoch_range = {"start": ep_min, "end": ep_max}
+
+    return {
+        "total_records": total,
+        "record_types": dict(type_counts),
+        "game_time_range": game_time_range,
+        "millis_since_epoch_range": millis_since_epoch_range,
+        "_scene_counts": dict(scene_counts),
+    }
+
+
 class LogSession:
     """
     Main session object for analyzing bWell log data.
@@ -58,6 +158,17 @@ class LogSession:
     For scene-specific analysis, use session.scene() to get a SceneView.
     """
 
+    __slots__ = (
+        "_records",
+        "_metadata",
+        "_scene_manager",
+        "_extractor",
+        "_timestamps",
+        "_type_index",
+        "_sender_index",
+        "_stats_cache",
+    )
+
     def __init__(
         self,
         records: list[LogRecord],
@@ -65,6 +176,7 @@ class LogSession:
         *,
         initialize_scene_manager: bool = False,
         _scene_manager: "SceneManager | None" = None,
+        _skip_clean: bool = False,
     ):
         """
         Initialize a log session.
@@ -74,9 +186,12 @@ class LogSession:
             metadata: Optional metadata about the session
             initialize_scene_manager: Whether to initialize scene manager immediately
             _scene_manager: Optional pre-existing scene manager (from parent session)
+            _skip_clean: Skip dedup/sort when the caller guarantees records
+                are derived from an already-clean session
         """
-        # Sort records by timestamp and remove duplicates
-        self._records = _clean_records(records)
+        # Sort records by timestamp and remove duplicates, unless they come
+        # from an already-clean parent session
+        self._records = records if _skip_clean else _clean_records(records)
         self._metadata = metadata or {}
 
         # Lazy-loaded components (unless eagerly initialized)
@@ -88,10 +203,29 @@ class LogSession:
 
         self._extractor: LogSessionExtractor | None = None
 
+        # Sorted timestamp index, built lazily on first time-range filter
+        self._timestamps: list[float] | None = None
+
+        # Record type -> record indices, built lazily on first type filter
+        self._type_index: dict[str, list[int]] | None = None
+
+        # Sender tag -> record indices, built lazily on first sender filter
+        self._sender_index: dict[str, list[int]] | None = None
+
+        # Memoized get_stats result
+        self._stats_cache: dict[str, Any] | None = None
+
     @property
     def records(self) -> list[LogRecord]:
-        """Get all records in the session."""
-        return copy.deepcopy(self._records)
+        """
+        Get all records in the session.
+
+        Returns a new list, so callers can add/remove entries freely, but
+        the record dicts themselves are shared with the session — treat
+        them as read-only. (A deep copy here cost O(n * record depth) per
+        access, which dominated filtering and export pipelines.)
+        """
+        return list(self._records)
 
     @property
     def metadata(self) -> dict[str, Any]:
@@ -106,6 +240,7 @@ class LogSession:
             metadata: Dictionary of metadata to add/update
         """
         self._metadata.update(metadata)
+        self._invalidate_caches()
 
     def set_metadata(self, key: str, value: Any) -> None:
         """
@@ -116,10 +251,18 @@ class LogSession:
             value: Metadata value
         """
         self._metadata[key] = value
+        self._invalidate_caches()
 
     def clear_metadata(self) -> None:
         """Clear all metadata."""
         self._metadata.clear()
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached extractor/stats state after metadata changes."""
+        if self._extractor is not None:
+            self._extractor._invalidate()
+        self._stats_cache = None
 
     def __len__(self) -> int:
         """Return number of records."""
@@ -182,36 +325,150 @@ class LogSession:
         scene_info = self.scene_manager.get_scene_info(name, instance)
         scene_records = self.scene_manager.get_scene_records(name, instance)
 
-        return SceneView(LogSession(scene_records, self._metadata), scene_info)
+        return SceneView(
+            LogSession(scene_records, self._metadata, _skip_clean=True),
+            scene_info,
+        )
 
-    def filter(self, condition: FilterFunction) -> "LogSession":
+    def filter(self, *conditions: FilterFunction) -> "LogSession":
         """
         Filter records and return a new session.
 
+        Several conditions can be passed at once; they are combined with
+        short-circuiting AND in a single pass over the records, avoiding one
+        intermediate session (and record list) per chained .filter() call.
+
         Args:
-            condition: Function that takes a record and returns bool
+            *conditions: Function(s) that take a record and return bool
 
         Returns:
             LogSession: New session with filtered records
         """
-        filtered_records = [r for r in self._records if condition(r)]
+        if not conditions:
+            raise TypeError("filter() requires at least one condition")
+
+        filtered_records = list(self._iter_filtered(conditions))
         return LogSession(
             filtered_records,
             self._metadata,
             _scene_manager=self._scene_manager,
+            _skip_clean=True,
         )
 
+    def _iter_filtered(
+        self, conditions: tuple[FilterFunction, ...]
+    ) -> Iterator[LogRecord]:
+        """Yield records matching all conditions without building a list."""
+        if len(conditions) == 1:
+            condition = conditions[0]
+            return (r for r in self._records if condition(r))
+        return (r for r in self._records if all(c(r) for c in conditions))
+
+    def _build_type_index(self) -> dict[str, list[int]]:
+        """Build (once) and return the record type -> indices index."""
+        if self._type_index is None:
+            index: dict[str, list[int]] = defaultdict(list)
+            for i, record in enumerate(self._records):
+                index[record.get(_RECORD_TYPE)].append(i)
+            self._type_index = dict(index)
+        return self._type_index
+
     def filter_type(self, *record_types: str) -> "LogSession":
         """
         Filter by record type(s).
 
+        The first call builds a type -> indices index in one pass; subsequent
+        calls are O(matches) dict lookups instead of full scans.
+
         Args:
             *record_types: One or more record types to include
 
         Returns:
             LogSession: New session with filtered records
         """
-        return self.filter(lambda r: r.get(RecordFields.RECORD_TYPE) in record_types)
+        type_index = self._build_type_index()
+
+        if len(record_types) == 1:
+            indices: list[int] = type_index.get(record_types[0], [])
+        else:
+            # Each per-type index list is already sorted, so an O(n log k)
+            # k-way merge restores record order without a full re-sort
+            indices = list(
+                heapq.merge(*(type_index.get(t, []) for t in set(record_types)))
+            )
+
+        filtered_records = [self._records[i] for i in indices]
+        return LogSession(
+            filtered_records,
+            self._metadata,
+            _scene_manager=self._scene_manager,
+            _skip_clean=True,
+        )
+
+    def count(self, *conditions: FilterFunction) -> int:
+        """
+        Count records matching the given condition(s).
+
+        Avoids materializing a filtered session (and its record list) when
+        only the count is needed, as in len(session.filter(...)).
+
+        Args:
+            *conditions: Function(s) that take a record and return bool.
+                With no conditions, returns the total record count.
+
+        Returns:
+            Number of matching records
+        """
+        if not conditions:
+            return len(self._records)
+        return sum(1 for _ in self._iter_filtered(conditions))
+
+    def count_type(self, *record_types: str) -> int:
+        """
+        Count records of the given type(s) via the type index.
+
+        Args:
+            *record_types: One or more record types to count
+
+        Returns:
+            Number of matching records
+        """
+        type_index = self._build_type_index()
+        return sum(len(type_index.get(t, ())) for t in set(record_types))
+
+    def filter_sender(self, *sender_tags: str) -> "LogSession":
+        """
+        Filter by sender tag(s) (e.g. MovementSources.HEAD).
+
+        Uses a lazily built sender -> indices index, so repeated calls avoid
+        re-scanning every record with a Python predicate.
+
+        Args:
+            *sender_tags: One or more sender tags to include
+
+        Returns:
+            LogSession: New session with filtered records
+        """
+        if self._sender_index is None:
+            index: dict[str, list[int]] = defaultdict(list)
+            for i, record in enumerate(self._records):
+                index[record.get(_SENDER_TAG)].append(i)
+            self._sender_index = dict(index)
+
+        if len(sender_tags) == 1:
+            indices: list[int] = self._sender_index.get(sender_tags[0], [])
+        else:
+            indices = list(
+                heapq.merge(*(self._sender_index.get(t, []) for t in set(sender_tags)))
+            )
+
+        filtered_records = [self._records[i] for i in indices]
+        return LogSession(
+            filtered_records,
+            self._metadata,
+            _scene_manager=self._scene_manager,
+            _skip_clean=True,
+        )
 
     def filter_time_range(self, start: float, end: float) -> "LogSession":
         """
@@ -228,12 +485,18 @@ class LogSession:
             LogSession: New session with filtered records
         """
         if not self._records:
-            return LogSession([], self._metadata, _scene_manager=self._scene_manager)
+            return LogSession(
+                [],
+                self._metadata,
+                _scene_manager=self._scene_manager,
+                _skip_clean=True,
+            )
 
-        timestamps = [r.get(RecordFields.GAME_TIME_SECS, 0.0) for r in self._records]
+        if self._timestamps is None:
+            self._timestamps = [r.get(_GAME_TIME_SECS, 0.0) for r in self._records]
 
-        start_idx = bisect.bisect_left(timestamps, start)
-        end_idx = bisect.bisect_right(timestamps, end)
+        start_idx = bisect.bisect_left(self._timestamps, start)
+        end_idx = bisect.bisect_right(self._timestamps, end)
 
         filtered_records = self._records[start_idx:end_idx]
 
@@ -241,81 +504,73 @@ class LogSession:
             filtered_records,
             self._metadata,
             _scene_manager=self._scene_manager,
+            _skip_clean=True,
         )
 
     def get_stats(self) -> dict[str, Any]:
         """
         Get statistics about the session.
 
+        The result is memoized; callers receive a fresh top-level dict each
+        time, recomputed only after metadata changes.
+
         Returns:
             Dictionary with session statistics
         """
-        if not self._records:
-            return {
-                "total_records": 0,
-                "record_types": {},
-                "game_time_range": None,
-                "millis_since_epoch_range": None,
-                "scenes": [],
-                "metadata": self._metadata,
-            }
-
-        # Count record types
-        type_counts: dict[str, int] = defaultdict(int)
-        for record in self._records:
-            record_type = record.get(RecordFields.RECORD_TYPE, "unknown")
-            type_counts[record_type] += 1
-
-        # Get game time range
-        game_time_stamps = [
-            r.get(RecordFields.GAME_TIME_SECS)
-            for r in self._records
-            if r.get(RecordFields.GAME_TIME_SECS) is not None
-        ]
-        game_time_range = None
-        if game_time_stamps:
-            # Filter out None values for min/max
-            valid_game_times = [t for t in game_time_stamps if t is not None]
-            if valid_game_times:
-                game_time_range = {
-                    "start": min(valid_game_times),
-                    "end": max(valid_game_times),
-                }
-
-        # Get millis since epoch range
-        epoch_stamps = [
-            r.get(RecordFields.MILLIS_SINCE_EPOCH)
-            for r in self._records
-            if r.get(RecordFields.MILLIS_SINCE_EPOCH) is not None
-        ]
-        millis_since_epoch_range = None
-        if epoch_stamps:
-            # Filter out None values for min/max
-            valid_epoch_times = [t for t in epoch_stamps if t is not None]
-            if valid_epoch_times:
-                millis_since_epoch_range = {
-                    "start": min(valid_epoch_times),
-                    "end": max(valid_epoch_times),
-                }
-
-        # Get scene info
+        if self._stats_cache is not None:
+            return self._stats_cache.copy()
+
+        stats = _compute_stats(self._records)
+        scene_counts = stats.pop("_scene_counts")
+
+        # Get scene info. Use the scene manager when one was already built;
+        # otherwise the scene-entry counts from the stats pass are enough,
+        # so stats never trigger an O(n) scene-index construction.
         scenes = []
-        try:
-            for scene_name in self.scene_manager.list_scenes():
-                scene_count = self.scene_manager.get_scene_count(scene_name)
-                scenes.append({"name": scene_name, "instances": scene_count})
-        except (AttributeError, TypeError, KeyError):
-            # If scene analysis fails for any reason, continue without it
-            pass
-
-        return {
-            "total_records": len(self._records),
-            "record_types": dict(type_counts),
-            "game_time_range": game_time_range,
-            "millis_since_epoch_range": millis_since_epoch_range,
-            "scenes": scenes,
-            "metadata": self._metadata,
-        }
+        if self._records and self._scene_manager is not None:
+            try:
+                for scene_name in self._scene_manager.list_scenes():
+                    scene_count = self._scene_manager.get_scene_count(scene_name)
+                    scenes.append({"name": scene_name, "instances": scene_count})
+            except (AttributeError, TypeError, KeyError):
+                # If scene analysis fails for any reason, continue without it
+                pass
+        else:
+            scenes = [
+                {"name": name, "instances": count}
+                for name, count in scene_counts.items()
+            ]
+
+        stats["scenes"] = scenes
+        stats["metadata"] = self._metadata
+        self._stats_cache = stats
+        return stats.copy()
+
+    def stats_with(self, *conditions: FilterFunction) -> dict[str, Any]:
+        """
+        Get statistics for records matching the given condition(s).
+
+        Equivalent to session.filter(...).get_stats() but streams over a
+        fused predicate, so no intermediate session or record list is
+        materialized. Scene instance counts come from the scene-entry
+        records in the matching slice.
+
+        Args:
+            *conditions: Function(s) that take a record and return bool
+
+        Returns:
+            Dictionary with statistics over the matching records
+        """
+        if not conditions:
+            raise TypeError("stats_with() requires at least one condition")
+
+        stats = _compute_stats(self._iter_filtered(conditions))
+        scene_counts = stats.pop("_scene_counts")
+        stats["scenes"] = [
+            {"name": name, "instances": count} for name, count in scene_counts.items()
+        ]
+        stats["metadata"] = self._metadata
+        return stats
 
     def to_pandas(
         self, flatten: bool = True, include_metadata: bool = False
@@ -334,6 +589,18 @@ class LogSession:
             flatten=flatten, include_metadata=include_metadata
         )
 
+    def to_arrow(self) -> "pa.Table":
+        """
+        Export session data to a pyarrow Table.
+
+        Nested dicts are preserved as Arrow struct columns, so this skips
+        the pandas flatten entirely.
+
+        Returns:
+            pa.Table: Table containing all log records
+        """
+        return self.extractor.to_arrow()
+
     def export_csv(self, file_path: str, **kwargs: Any) -> None:
         """
         Export session data to CSV file.
@@ -364,6 +631,8 @@ class SceneView:
     via composition to avoid duplication.
     """
 
+    __slots__ = ("_session", "_scene_info", "_extractor", "_stats_cache")
+
     def __init__(self, session: LogSession, scene_info: SceneInfo):
         """
         Initialize scene view.
@@ -375,6 +644,7 @@ class SceneView:
         self._session = session
         self._scene_info = scene_info
         self._extractor: SceneViewExtractor | None = None
+        self._stats_cache: dict[str, Any] | None = None
 
     @property
     def records(self) -> list[LogRecord]:
@@ -399,6 +669,7 @@ class SceneView:
             metadata: Dictionary of metadata to add/update
         """
         self._session.update_metadata(metadata)
+        self._stats_cache = None
 
     def set_metadata(self, key: str, value: Any) -> None:
         """
@@ -409,10 +680,12 @@ class SceneView:
             value: Metadata value
         """
         self._session.set_metadata(key, value)
+        self._stats_cache = None
 
     def clear_metadata(self) -> None:
         """Clear all metadata."""
         self._session.clear_metadata()
+        self._stats_cache = None
 
     @property
     def extractor(self) -> SceneViewExtractor:
@@ -437,17 +710,17 @@ class SceneView:
         )
 
     # Delegate filtering operations to wrapped session
-    def filter(self, condition: FilterFunction) -> "SceneView":
+    def filter(self, *conditions: FilterFunction) -> "SceneView":
         """
         Filter scene records and return a new scene view.
 
         Args:
-            condition: Function that takes a record and returns bool
+            *conditions: Function(s) that take a record and return bool
 
         Returns:
             SceneView: New scene view with filtered records
         """
-        filtered_session = self._session.filter(condition)
+        filtered_session = self._session.filter(*conditions)
         return SceneView(filtered_session, self._scene_info)
 
     def filter_type(self, *record_types: str) -> "SceneView":
@@ -463,6 +736,44 @@ class SceneView:
         filtered_session = self._session.filter_type(*record_types)
         return SceneView(filtered_session, self._scene_info)
 
+    def count(self, *conditions: FilterFunction) -> int:
+        """
+        Count scene records matching the given condition(s).
+
+        Args:
+            *conditions: Function(s) that take a record and return bool.
+                With no conditions, returns the total record count.
+
+        Returns:
+            Number of matching records
+        """
+        return self._session.count(*conditions)
+
+    def count_type(self, *record_types: str) -> int:
+        """
+        Count scene records of the given type(s).
+
+        Args:
+            *record_types: One or more record types to count
+
+        Returns:
+            Number of matching records
+        """
+        return self._session.count_type(*record_types)
+
+    def filter_sender(self, *sender_tags: str) -> "SceneView":
+        """
+        Filter by sender tag(s) within the scene.
+
+        Args:
+            *sender_tags: One or more sender tags to include
+
+        Returns:
+            SceneView: New scene view with filtered records
+        """
+        filtered_session = self._session.filter_sender(*sender_tags)
+        return SceneView(filtered_session, self._scene_info)
+
     def filter_time_range(self, start: float, end: float) -> "SceneView":
         """
         Filter by game time range within the scene.
@@ -481,9 +792,15 @@ class SceneView:
         """
         Get statistics about the scene.
 
+        The result is memoized; callers receive a fresh top-level dict each
+        time, recomputed only after metadata changes.
+
         Returns:
             Dictionary with scene-specific statistics
         """
+        if self._stats_cache is not None:
+            return self._stats_cache.copy()
+
         base_stats = self._session.get_stats()
 
         # Add scene-specific information
@@ -501,7 +818,8 @@ class SceneView:
         if "scenes" in base_stats:
             del base_stats["scenes"]
 
-        return base_stats
+        self._stats_cache = base_stats
+        return self._stats_cache.copy()
 
     def to_pandas(
         self,
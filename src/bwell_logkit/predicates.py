@@ -0,0 +1,38 @@
+"""
+Reusable record predicates for use with LogSession.filter.
+"""
+
+from typing import Any
+
+from .types import LogRecord
+
+
+class Eq:
+    """
+    Equality predicate on a single record field.
+
+    Binds the field name and comparison constant once at construction, so
+    evaluating a record avoids the closure/global lookups a hand-written
+    lambda pays per row. Records missing the field evaluate to False
+    (unless compared against None).
+    """
+
+    __slots__ = ("_field", "_value")
+
+    def __init__(self, field: str, value: Any):
+        """
+        Initialize the predicate.
+
+        Args:
+            field: Record field name to compare
+            value: Value the field must equal
+        """
+        self._field = field
+        self._value = value
+
+    def __call__(self, record: LogRecord) -> bool:
+        """Return True if the record's field equals the bound value."""
+        return record.get(self._field) == self._value
+
+    def __repr__(self) -> str:
+        return f"Eq({self._field!r}, {self._value!r})"
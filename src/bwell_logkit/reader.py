@@ -3,6 +3,12 @@ File reading and parsing for bWell log data.
 """
 
 import concurrent.futures
+import fnmatch
+import functools
+import mmap
+import os
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -10,10 +16,19 @@ import orjson
 
 from .exceptions import LogReadError
 from .logs import LogSession
-from .types import FilePath, LogRecord
+from .types import FilePath, LogRecord, RecordFields
 
+# Low-cardinality string fields whose values are interned at parse time, so
+# later equality checks (type/sender filters, scene segmentation) hit the
+# pointer-comparison fast path and repeated values share one string object
+_INTERN_FIELDS = (
+    RecordFields.RECORD_TYPE,
+    RecordFields.SENDER_TAG,
+    RecordFields.SceneEntry.SCENE_NAME,
+)
 
-def _heal_json(content: str) -> str:
+
+def _heal_json(content: bytes) -> bytes:
     """
     Heal truncated bWell log JSON content.
 
@@ -29,28 +44,77 @@ def _heal_json(content: str) -> str:
     if not healed:
         return healed
 
-    # Remove trailing comma if present
-    if healed.endswith(","):
-        healed = healed[:-1]
+    # Inspect only the last few bytes and rebuild the content with a single
+    # concatenation, rather than slicing off the comma and appending
+    # brackets in separate steps (each of which copies the whole buffer)
+    end = len(healed)
+    if healed[end - 1] == 0x2C:  # trailing ","
+        end -= 1
+
+    tail = healed[max(0, end - 2) : end]
+    if tail.endswith(b"]}"):
+        suffix = b""
+    elif tail.endswith(b"]"):
+        suffix = b"}"
+    else:
+        suffix = b"]}"
 
-    # Add missing closing brackets
-    if healed.endswith("]}"):
+    if end == len(healed) and not suffix:
         # Already properly closed
-        pass
-    elif healed.endswith("]"):
-        # Missing only the closing }
-        healed += "}"
-    else:
-        # Missing both ] and }
-        healed += "]}"
+        return healed
+    return b"".join((memoryview(healed)[:end], suffix))
+
+
+def _parse_ndjson(content: bytes) -> "list[LogRecord] | None":
+    """
+    Parse newline-delimited JSON (one record object per line).
+
+    Returns the record list, or None when the content is not NDJSON-shaped
+    (the first non-empty line must be a complete JSON object and at least
+    two lines must be present, so wrapped or truncated documents fall
+    through to healing).
+    """
+    lines = [line for line in content.splitlines() if line.strip()]
+    if len(lines) < 2:
+        return None
+
+    try:
+        first = orjson.loads(lines[0])
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(first, dict):
+        return None
+
+    try:
+        return [first] + [orjson.loads(line) for line in lines[1:]]
+    except orjson.JSONDecodeError:
+        return None
+
 
-    return healed
+def _intern_common_fields(records: list[LogRecord]) -> None:
+    """Intern low-cardinality string field values in place."""
+    intern = sys.intern
+    for record in records:
+        if type(record) is not dict:
+            continue
+        for field in _INTERN_FIELDS:
+            value = record.get(field)
+            if type(value) is str:
+                record[field] = intern(value)
 
 
 def read_records(file_path: FilePath, encoding: str = "utf-8") -> list[LogRecord]:
     """
     Read and parse a bWell log file with automatic JSON healing.
 
+    Both the wrapped {"data": [...]} form and newline-delimited JSON (one
+    record object per line) are accepted.
+
+    Parse results are memoized per (path, mtime, size), so re-reading an
+    unchanged file — common in notebooks — skips the parse entirely.
+    Callers get a fresh list each time but the record dicts are shared;
+    treat them as read-only, as with LogSession.records.
+
     Args:
         file_path: Path to the log file
         encoding: File encoding (default: utf-8)
@@ -63,30 +127,99 @@ def read_records(file_path: FilePath, encoding: str = "utf-8") -> list[LogRecord
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
         raise LogReadError(f"File not found: {file_path}", str(file_path))
+    except OSError as e:
+        raise LogReadError(f"Unexpected error reading file: {e}", str(file_path), e)
+
+    return list(
+        _read_records_cached(str(file_path), stat.st_mtime_ns, stat.st_size, encoding)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _read_records_cached(
+    path_str: str, mtime_ns: int, size: int, encoding: str
+) -> tuple[LogRecord, ...]:
+    """Parse a log file, memoized on path plus content identity.
+
+    mtime_ns and size participate only in the cache key, so edits and
+    rewrites invalidate naturally. Failures are not cached (lru_cache
+    does not store raised exceptions).
+    """
+    return tuple(_parse_log_file(Path(path_str), encoding))
+
 
+def _parse_log_file(file_path: Path, encoding: str) -> list[LogRecord]:
+    """Read, heal and parse a log file (uncached)."""
     try:
-        # Read raw content
-        content = file_path.read_text(encoding=encoding).strip().replace("\n", "")
-
-        if not content:
-            raise LogReadError("File is empty", str(file_path))
-
-        # Try parsing as-is first
-        try:
-            data = orjson.loads(content)
-        except orjson.JSONDecodeError:
-            # Attempt to heal the JSON
-            healed_content = _heal_json(content)
+        # Memory-map the file instead of copying it into the heap; orjson
+        # parses straight from the mapped buffer (and tolerates surrounding
+        # whitespace/newlines), so the happy path never duplicates the file
+        # contents in Python memory
+        with open(file_path, "rb") as f:
             try:
-                data = orjson.loads(healed_content)
-            except orjson.JSONDecodeError as e:
-                raise LogReadError(
-                    f"Failed to parse JSON even after healing: {e}",
-                    str(file_path),
-                    e,
-                )
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length files cannot be mapped
+                raise LogReadError("File is empty", str(file_path))
+
+        with mm:
+            view = memoryview(mm)
+            content: bytes | memoryview = view
+            try:
+                if encoding.lower() not in ("utf-8", "utf8"):
+                    # orjson requires UTF-8 input; transcode only when asked
+                    # for another encoding (this necessarily materializes)
+                    content = bytes(mm).decode(encoding).encode("utf-8")
+
+                # Fast-fail list-rooted documents before paying for a full
+                # parse: "[" can only open a valid-but-rejected root, so a
+                # multi-MB array is refused in microseconds. Other leading
+                # bytes fall through, keeping the parse-failure error for
+                # genuinely invalid content.
+                idx = 0
+                n = len(content)
+                while idx < n and content[idx] in (0x20, 0x09, 0x0A, 0x0D):
+                    idx += 1
+                if idx == n:
+                    raise LogReadError("File is empty", str(file_path))
+                if content[idx] == 0x5B:  # "["
+                    raise LogReadError(
+                        "Invalid log format: root must be an object",
+                        str(file_path),
+                    )
+
+                # Try parsing as-is first
+                try:
+                    data = orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    raw = bytes(content)
+
+                    # NDJSON fast path: some exports store one record object
+                    # per line instead of the wrapped {"data": [...]} form
+                    ndjson_records = _parse_ndjson(raw)
+                    if ndjson_records is not None:
+                        data = {"data": ndjson_records}
+                    else:
+                        # Attempt to heal the JSON; healing has to build a
+                        # patched copy anyway, so materializing here is free
+                        healed_content = _heal_json(raw)
+                        if not healed_content:
+                            raise LogReadError("File is empty", str(file_path))
+                        try:
+                            data = orjson.loads(healed_content)
+                        except orjson.JSONDecodeError as e:
+                            raise LogReadError(
+                                f"Failed to parse JSON even after healing: {e}",
+                                str(file_path),
+                                e,
+                            )
+            finally:
+                # Release the exported buffer so the mapping can close
+                view.release()
 
         # Extract records from the data structure
         if not isinstance(data, dict):
@@ -100,6 +233,7 @@ def read_records(file_path: FilePath, encoding: str = "utf-8") -> list[LogRecord
                 "Invalid log format: missing 'data' array", str(file_path)
             )
 
+        _intern_common_fields(records)
         return records
 
     except Exception as e:
@@ -123,12 +257,55 @@ def load_log(file_path: FilePath, **kwargs: Any) -> LogSession:
     return LogSession(records, metadata={"file_path": str(file_path)})
 
 
+def _load_single_log(
+    file_path: Path, folder_path: Path, kwargs: dict[str, Any]
+) -> tuple[str, "LogSession | Exception"]:
+    """Load a single log file and return (relative_path, result).
+
+    Module-level so it can be pickled for process-based executors.
+    """
+    relative_path = file_path.relative_to(folder_path).as_posix()
+    try:
+        session = load_log(file_path, **kwargs)
+        # Update metadata to include relative path
+        session.set_metadata("relative_path", relative_path)
+        return (relative_path, session)
+    except Exception as e:
+        return (relative_path, e)
+
+
+def _find_log_files(folder_path: Path, file_pattern: str) -> list[Path]:
+    """Recursively collect files whose name matches file_pattern.
+
+    Walks with os.scandir instead of Path.rglob: scandir surfaces the
+    file-vs-directory type straight from the directory entries, so the
+    walk needs no per-entry stat calls or intermediate Path objects.
+    """
+    # Translate the glob once up front; fnmatch.fnmatch would re-derive
+    # (or at least re-look-up) the regex for every directory entry
+    match = re.compile(fnmatch.translate(file_pattern)).match
+
+    matches: list[Path] = []
+    stack = [str(folder_path)]
+
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif match(entry.name):
+                    matches.append(Path(entry.path))
+
+    return matches
+
+
 def load_all_logs(
     folder_path: FilePath,
     *,
     file_pattern: str = "*.json",
     max_workers: int | None = None,
     skip_errors: bool = True,
+    executor: str = "thread",
     **kwargs: Any,
 ) -> dict[str, LogSession]:
     """
@@ -137,8 +314,10 @@ def load_all_logs(
     Args:
         folder_path: Path to the folder containing log files
         file_pattern: Glob pattern for log files (default: "*.json")
-        max_workers: Maximum # of workers (default: None / TPE default)
+        max_workers: Maximum # of workers (default: None / executor default)
         skip_errors: If True, skip failed files; if False, raise on 1st error
+        executor: "thread" (default) or "process". Processes sidestep the GIL
+            during CPU-bound JSON parsing at the cost of pickling results.
         **kwargs: Additional options passed to read_records
 
     Returns:
@@ -147,6 +326,7 @@ def load_all_logs(
     Raises:
         LogReadError: If folder doesn't exist / if skip_errors=False and any
         file fails to load
+        ValueError: If executor is not "thread" or "process"
     """
     folder_path = Path(folder_path)
 
@@ -156,39 +336,37 @@ def load_all_logs(
     if not folder_path.is_dir():
         raise LogReadError(f"Path is not a directory: {folder_path}", str(folder_path))
 
+    if executor == "thread":
+        executor_cls: type[concurrent.futures.Executor] = (
+            concurrent.futures.ThreadPoolExecutor
+        )
+    elif executor == "process":
+        executor_cls = concurrent.futures.ProcessPoolExecutor
+    else:
+        raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+
     # Find all log files recursively
-    log_files = list(folder_path.rglob(file_pattern))
+    log_files = _find_log_files(folder_path, file_pattern)
 
     if not log_files:
         return {}
 
-    def load_single_log(file_path: Path) -> tuple[str, LogSession | Exception]:
-        """Load a single log file and return (relative_path, result)."""
-        try:
-            relative_path = file_path.relative_to(folder_path).as_posix()
-            session = load_log(file_path, **kwargs)
-            # Update metadata to include relative path
-            session.set_metadata("relative_path", relative_path)
-            return (relative_path, session)
-        except Exception as e:
-            relative_path = file_path.relative_to(folder_path).as_posix()
-            return (relative_path, e)
+    # Batch files per worker to amortize task-dispatch (and, for processes,
+    # pickling) overhead. Thread pools ignore chunksize.
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(log_files) // (workers * 4))
+
+    load_single_log = functools.partial(
+        _load_single_log, folder_path=folder_path, kwargs=kwargs
+    )
 
     results: dict[str, LogSession] = {}
     errors: list[tuple[str, Exception]] = []
 
-    # Use ThreadPoolExecutor for parallel loading
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_file = {
-            executor.submit(load_single_log, file_path): file_path
-            for file_path in log_files
-        }
-
-        # Collect results
-        for future in concurrent.futures.as_completed(future_to_file):
-            relative_path, result = future.result()
-
+    with executor_cls(max_workers=max_workers) as pool:
+        for relative_path, result in pool.map(
+            load_single_log, log_files, chunksize=chunksize
+        ):
             if isinstance(result, Exception):
                 errors.append((relative_path, result))
                 if not skip_errors:
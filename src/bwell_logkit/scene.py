@@ -1,11 +1,24 @@
 """Scene management and segmentation for bWell log data."""
 
-from collections import defaultdict
+import bisect
+from operator import attrgetter
 from typing import Literal, Optional
 
 from .exceptions import SceneNotFoundError
 from .types import LogRecord, RecordFields, RecordTypes, SceneInfo
 
+# Field/type names used in per-record loops, bound once at import time so
+# the loops do plain global loads instead of chained attribute lookups
+_RECORD_TYPE = RecordFields.RECORD_TYPE
+_GAME_TIME_SECS = RecordFields.GAME_TIME_SECS
+_MILLIS_SINCE_EPOCH = RecordFields.MILLIS_SINCE_EPOCH
+_SCENE_NAME = RecordFields.SceneEntry.SCENE_NAME
+_SCENE_ENTRY = RecordTypes.SCENE_ENTRY
+
+# C-level sort keys for scene instance ordering
+_BY_GAME_TIME = attrgetter("start_game_time_secs")
+_BY_EPOCH = attrgetter("start_millis_since_epoch")
+
 
 class SceneManager:
     """Manages scene segmentation and provides access to scene instances."""
@@ -14,66 +27,87 @@ class SceneManager:
         self._records = records
         self._scenes = self._build_scene_index()
 
+        # The scene index is immutable after construction, so the name list
+        # and the flattened instance list are frozen once here; accessors
+        # hand out fresh lists built from these tuples
+        self._scene_names = tuple(self._scenes)
+        self._all_instances = tuple(
+            info for instances in self._scenes.values() for info in instances
+        )
+
+        # Sorted variants of _all_instances, memoized per sort key on first
+        # request
+        self._sorted_instances: dict[str, tuple[SceneInfo, ...]] = {}
+
+        # Sorted timestamp index, built lazily on the first record lookup.
+        # Records arrive time-ordered (LogSession sorts on construction).
+        self._timestamps: list[float] | None = None
+
     def _build_scene_index(self) -> dict[str, list[SceneInfo]]:
-        scene_entries = [
-            r
-            for r in self._records
-            if r.get(RecordFields.RECORD_TYPE) == RecordTypes.SCENE_ENTRY
-        ]
+        # Collect the scene entries and the log's final timestamps (used to
+        # close the last scene, which has no successor to bound it) in one
+        # pass over the records instead of a filter pass plus max passes
+        scene_entries = []
+        last_gt = None
+        last_epoch = None
+
+        for r in self._records:
+            if r.get(_RECORD_TYPE) == _SCENE_ENTRY:
+                scene_entries.append(r)
+
+            gt = r.get(_GAME_TIME_SECS, 0)
+            if last_gt is None or gt > last_gt:
+                last_gt = gt
+            epoch = r.get(_MILLIS_SINCE_EPOCH, 0)
+            if last_epoch is None or epoch > last_epoch:
+                last_epoch = epoch
 
         if not scene_entries:
             return {}
 
-        scenes: dict[str, list[SceneInfo]] = defaultdict(list)
+        scenes: dict[str, list[SceneInfo]] = {}
 
         for i, entry in enumerate(scene_entries):
-            scene_name = entry.get(RecordFields.SceneEntry.SCENE_NAME)
+            scene_name = entry.get(_SCENE_NAME)
 
             if not scene_name:
                 continue
 
-            start_gt = entry.get(RecordFields.GAME_TIME_SECS, 0)
-            start_epoch = entry.get(RecordFields.MILLIS_SINCE_EPOCH, 0)
+            start_gt = entry.get(_GAME_TIME_SECS, 0)
+            start_epoch = entry.get(_MILLIS_SINCE_EPOCH, 0)
 
             if i + 1 < len(scene_entries):
-                end_gt = scene_entries[i + 1].get(RecordFields.GAME_TIME_SECS, start_gt)
-                end_epoch = scene_entries[i + 1].get(
-                    RecordFields.MILLIS_SINCE_EPOCH, start_epoch
-                )
+                end_gt = scene_entries[i + 1].get(_GAME_TIME_SECS, start_gt)
+                end_epoch = scene_entries[i + 1].get(_MILLIS_SINCE_EPOCH, start_epoch)
             else:
-                # Find the last record's timestamp
-                gt_timestamps = [
-                    r.get(RecordFields.GAME_TIME_SECS, 0) for r in self._records
-                ]
-                epoch_timestamps = [
-                    r.get(RecordFields.MILLIS_SINCE_EPOCH, 0) for r in self._records
-                ]
-                end_gt = max(gt_timestamps, default=start_gt)
-                end_epoch = max(epoch_timestamps, default=start_epoch)
+                # Close the final scene at the last record's timestamps
+                end_gt = last_gt if last_gt is not None else start_gt
+                end_epoch = last_epoch if last_epoch is not None else start_epoch
 
             end_gt = float(end_gt) if end_gt is not None else start_gt
             end_epoch = int(end_epoch) if end_epoch is not None else start_epoch
 
-            instance_idx = len(scenes[scene_name])
-            scenes[scene_name].append(
+            instances = scenes.setdefault(scene_name, [])
+            instances.append(
                 SceneInfo(
                     name=scene_name,
-                    instance=instance_idx,
+                    instance=len(instances),
                     start_game_time_secs=start_gt,
                     end_game_time_secs=end_gt,
                     start_millis_since_epoch=start_epoch,
                     end_millis_since_epoch=end_epoch,
                 )
             )
-        return dict(scenes)
+        return scenes
 
     def list_scenes(self) -> list[str]:
         """List all available scene names."""
-        return list(self._scenes.keys())
+        return list(self._scene_names)
 
     def has_scene(self, scene_name: str, instance: int = 0) -> bool:
         """Check if a scene instance exists."""
-        return scene_name in self._scenes and instance < len(self._scenes[scene_name])
+        instances = self._scenes.get(scene_name)
+        return instances is not None and instance < len(instances)
 
     def get_scene_count(self, scene_name: str) -> int:
         """Get the number of instances for a scene."""
@@ -81,20 +115,29 @@ class SceneManager:
 
     def get_scene_info(self, scene_name: str, instance: int = 0) -> SceneInfo:
         """Get information about a specific scene instance."""
-        if not self.has_scene(scene_name, instance):
+        # Single dict lookup on the success path; the available-scenes list
+        # for the error message is only built when the lookup fails
+        instances = self._scenes.get(scene_name)
+        if instances is None or instance >= len(instances):
             raise SceneNotFoundError(scene_name, instance, self.list_scenes())
-        return self._scenes[scene_name][instance]
+        return instances[instance]
 
     def get_scene_records(self, scene_name: str, instance: int = 0) -> list[LogRecord]:
-        """Get all records within a specific scene instance."""
+        """
+        Get all records within a specific scene instance.
+
+        Records are sorted by timestamp, so the scene window is located by
+        binary search over a cached timestamp index instead of scanning and
+        bounds-testing every record per lookup.
+        """
         info = self.get_scene_info(scene_name, instance)
-        return [
-            r
-            for r in self._records
-            if info.start_game_time_secs
-            <= r.get(RecordFields.GAME_TIME_SECS, 0)
-            <= info.end_game_time_secs
-        ]
+
+        if self._timestamps is None:
+            self._timestamps = [r.get(_GAME_TIME_SECS, 0) for r in self._records]
+
+        lo = bisect.bisect_left(self._timestamps, info.start_game_time_secs)
+        hi = bisect.bisect_right(self._timestamps, info.end_game_time_secs)
+        return self._records[lo:hi]
 
     def get_scene_instances(
         self,
@@ -121,30 +164,46 @@ class SceneManager:
             if scene_name not in self._scenes:
                 raise SceneNotFoundError(scene_name, 0, self.list_scenes())
             instances = list(self._scenes[scene_name])
-        else:
-            instances = []
-            for inst_list in self._scenes.values():
-                instances.extend(inst_list)
-
-        if sort_by == "epoch":
-            instances.sort(key=lambda s: s.start_millis_since_epoch)
-        elif sort_by == "game_time":
-            instances.sort(key=lambda s: s.start_game_time_secs)
-
-        return instances
+            if sort_by == "epoch":
+                instances.sort(key=_BY_EPOCH)
+            elif sort_by == "game_time":
+                instances.sort(key=_BY_GAME_TIME)
+            return instances
+
+        if sort_by in ("epoch", "game_time"):
+            # The all-scenes orderings never change; sort once per key and
+            # serve copies afterwards
+            cached = self._sorted_instances.get(sort_by)
+            if cached is None:
+                key = _BY_EPOCH if sort_by == "epoch" else _BY_GAME_TIME
+                cached = tuple(sorted(self._all_instances, key=key))
+                self._sorted_instances[sort_by] = cached
+            return list(cached)
+
+        return list(self._all_instances)
+
+    def get_scene_summary(self, include_instances: bool = True) -> dict[str, dict]:
+        """
+        Get a summary of all scenes and their instances.
 
-    def get_scene_summary(self) -> dict[str, dict]:
-        """Get a summary of all scenes and their instances."""
+        Args:
+            include_instances: Whether to include the per-instance detail
+                list under each scene's "instances" key. Pass False when
+                only the aggregate counts and durations are needed, to skip
+                materializing one dict per instance.
+        """
         summary = {}
         for name, instances in self._scenes.items():
             total_duration = sum(i.duration_secs for i in instances)
-            summary[name] = {
+            scene_summary = {
                 "instance_count": len(instances),
                 "total_duration_secs": total_duration,
                 "average_duration_secs": (
                     total_duration / len(instances) if instances else 0
                 ),
-                "instances": [
+            }
+            if include_instances:
+                scene_summary["instances"] = [
                     {
                         "instance": i.instance,
                         "start_game_time_secs": i.start_game_time_secs,
@@ -154,6 +213,6 @@ class SceneManager:
                         "end_millis_since_epoch": i.end_millis_since_epoch,
                     }
                     for i in instances
-                ],
-            }
+                ]
+            summary[name] = scene_summary
         return summary
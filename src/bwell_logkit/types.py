@@ -19,6 +19,7 @@ class RecordFields:
     RECORD_TYPE = "myType"
     GAME_TIME_SECS = "timestamp"
     MILLIS_SINCE_EPOCH = "msSinceEpoch"
+    SENDER_TAG = "senderTag"
     ID = "ID"
 
     class SceneEntry:
@@ -125,7 +126,7 @@ class LabResults:
 
 
 # Scene metadata
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SceneInfo:
     """Information about a scene instance."""
 
@@ -6,31 +6,25 @@ import pandas as pd
 import pytest
 
 from bwell_logkit.exceptions import ExtractionError
-from bwell_logkit.extractor import (
-    LogSessionExtractor,
-    SceneViewExtractor,
-    _flatten_dataframe,
-)
+from bwell_logkit.extractor import LogSessionExtractor, SceneViewExtractor
 from bwell_logkit.logs import LogSession
 from bwell_logkit.types import SceneInfo
 
 
-class TestFlattenDataframe:
-    """Test the _flatten_dataframe utility function."""
+class TestFlattening:
+    """Test record flattening behavior in to_pandas."""
 
     def test_flatten_basic(self):
-        """Test basic DataFrame flattening."""
-        df = pd.DataFrame(
-            [
-                {
-                    "simple": "value",
-                    "nested": {"x": 1, "y": 2},
-                    "another": {"a": "test", "b": 5},
-                }
-            ]
-        )
+        """Test basic record flattening."""
+        records = [
+            {
+                "simple": "value",
+                "nested": {"x": 1, "y": 2},
+                "another": {"a": "test", "b": 5},
+            }
+        ]
 
-        flattened = _flatten_dataframe(df)
+        flattened = LogSessionExtractor(records, {}).to_pandas(flatten=True)
 
         assert "simple" in flattened.columns
         assert "nested_x" in flattened.columns
@@ -46,10 +40,10 @@ class TestFlattenDataframe:
         assert flattened.iloc[0]["another_b"] == 5
 
     def test_flatten_no_nested_data(self):
-        """Test flattening DataFrame with no nested data."""
-        df = pd.DataFrame([{"a": 1, "b": 2, "c": "test"}])
+        """Test flattening records with no nested data."""
+        records = [{"a": 1, "b": 2, "c": "test"}]
 
-        flattened = _flatten_dataframe(df)
+        flattened = LogSessionExtractor(records, {}).to_pandas(flatten=True)
 
         # Should be unchanged
         assert list(flattened.columns) == ["a", "b", "c"]
@@ -57,10 +51,9 @@ class TestFlattenDataframe:
         assert flattened.iloc[0]["b"] == 2
         assert flattened.iloc[0]["c"] == "test"
 
-    def test_flatten_empty_dataframe(self):
-        """Test flattening empty DataFrame."""
-        df = pd.DataFrame()
-        flattened = _flatten_dataframe(df)
+    def test_flatten_empty_records(self):
+        """Test flattening with no records."""
+        flattened = LogSessionExtractor([], {}).to_pandas(flatten=True)
         assert len(flattened) == 0
 
 
@@ -134,6 +127,17 @@ class TestLogSessionExtractor:
         extractor.export_csv(str(output_file))
         assert output_file.exists()
 
+    def test_export_csv_flattens_nested_columns(self, sample_records, tmp_path):
+        """Test that the default CSV path writes flattened column names."""
+        extractor = LogSessionExtractor(sample_records, {})
+        output_file = tmp_path / "flat.csv"
+
+        extractor.export_csv(str(output_file))
+
+        header = output_file.read_text().splitlines()[0]
+        assert "absolutePosition_x" in header
+        assert "myType" in header
+
     def test_export_csv_with_kwargs(self, sample_records, tmp_path):
         """Test CSV export with custom kwargs."""
         extractor = LogSessionExtractor(sample_records, {})
@@ -145,6 +149,69 @@ class TestLogSessionExtractor:
         content = output_file.read_text()
         assert ";" in content  # Custom separator
 
+    def test_export_csv_with_header_and_encoding_kwargs(
+        self, sample_records, tmp_path
+    ):
+        """Test CSV export honoring caller header/encoding kwargs."""
+        extractor = LogSessionExtractor(sample_records, {})
+        output_file = tmp_path / "no_header.csv"
+
+        extractor.export_csv(
+            str(output_file), sep=";", header=False, encoding="utf-16"
+        )
+
+        content = output_file.read_text(encoding="utf-16")
+        assert "myType" not in content  # No header row written
+        assert ";" in content
+
+    def test_to_pandas_categorical_columns(self, sample_records):
+        """Test that repeated string columns become categorical dtype."""
+        extractor = LogSessionExtractor(sample_records, {})
+
+        df = extractor.to_pandas()
+        assert df["myType"].dtype == "category"
+        assert df["senderTag"].dtype == "category"
+        assert df.iloc[0]["myType"] == "AbsoluteActivityRecord"
+
+        # Conversion can be disabled
+        df_plain = extractor.to_pandas(categorical_columns=())
+        assert df_plain["myType"].dtype != "category"
+
+    def test_to_pandas_caches_result(self, sample_records):
+        """Test that repeated to_pandas calls reuse the cached DataFrame."""
+        extractor = LogSessionExtractor(sample_records, {})
+
+        df1 = extractor.to_pandas()
+        df2 = extractor.to_pandas()
+        assert df1 is df2
+
+        # Different argument combinations are cached separately
+        df3 = extractor.to_pandas(flatten=False)
+        assert df3 is not df1
+
+    def test_to_pandas_cache_invalidated_on_metadata_change(self, sample_records):
+        """Test that metadata changes invalidate the session's cache."""
+        session = LogSession(sample_records)
+        df1 = session.to_pandas(include_metadata=True)
+        assert "session_user" not in df1.columns
+
+        session.set_metadata("user", "test_user")
+        df2 = session.to_pandas(include_metadata=True)
+        assert "session_user" in df2.columns
+
+    def test_to_arrow_basic(self, sample_records):
+        """Test pyarrow Table export."""
+        extractor = LogSessionExtractor(sample_records, {})
+        table = extractor.to_arrow()
+
+        assert table.num_rows == 9
+        assert "myType" in table.column_names
+        # Nested dicts become struct columns
+        assert "absolutePosition" in table.column_names
+
+        # Table is cached across calls
+        assert extractor.to_arrow() is table
+
     def test_export_parquet_basic(self, sample_records, tmp_path):
         """Test Parquet export functionality."""
         extractor = LogSessionExtractor(sample_records, {})
@@ -160,6 +227,28 @@ class TestLogSessionExtractor:
         assert len(df_read) == 9
         assert "myType" in df_read.columns
 
+    def test_export_parquet_preserves_nested_structs(self, sample_records, tmp_path):
+        """Test that the default Parquet path keeps nested columns."""
+        extractor = LogSessionExtractor(sample_records, {})
+        output_file = tmp_path / "nested.parquet"
+
+        extractor.export_parquet(str(output_file))
+
+        df_read = pd.read_parquet(output_file)
+        assert "absolutePosition" in df_read.columns
+        assert "absolutePosition_x" not in df_read.columns
+
+    def test_export_parquet_flattened(self, sample_records, tmp_path):
+        """Test Parquet export with flattening enabled."""
+        extractor = LogSessionExtractor(sample_records, {})
+        output_file = tmp_path / "flat.parquet"
+
+        extractor.export_parquet(str(output_file), flatten=True)
+
+        df_read = pd.read_parquet(output_file)
+        assert "absolutePosition_x" in df_read.columns
+        assert "absolutePosition" not in df_read.columns
+
 
 class TestSceneViewExtractor:
     """Test cases for SceneViewExtractor class."""
@@ -287,11 +376,12 @@ class TestExtractorErrorHandling:
         scene_info = SceneInfo("TestScene", 0, 1.0, 10.0, 1000, 10000)
         extractor = SceneViewExtractor(session, scene_info)
 
-        # Mock the session's to_pandas method to raise an error
+        # Mock the session's to_pandas method to raise an error. LogSession
+        # uses __slots__, so patch at the class level.
         def mock_to_pandas(*args, **kwargs):
             raise ValueError("Mock session error")
 
-        monkeypatch.setattr(session, "to_pandas", mock_to_pandas)
+        monkeypatch.setattr(LogSession, "to_pandas", mock_to_pandas)
 
         with pytest.raises(ExtractionError) as exc_info:
             extractor.to_pandas()
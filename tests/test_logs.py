@@ -75,16 +75,17 @@ class TestLogSession:
         assert session.metadata["file_path"] == "/test/path.json"
         assert session.metadata["user"] == "test_user"
 
-    def test_records_property_returns_copy(self, sample_records):
-        """Test that records property returns a copy."""
+    def test_records_property_returns_shallow_copy(self, sample_records):
+        """Test that records property returns a new list of shared dicts."""
         session = LogSession(sample_records)
         records_copy = session.records
 
-        # Modify the copy
-        records_copy[0]["modified"] = True
+        # Mutating the list does not affect the session
+        records_copy.clear()
+        assert len(session.records) == len(sample_records)
 
-        # Original should be unchanged
-        assert "modified" not in session.records[0]
+        # The record dicts themselves are shared (read-only by contract)
+        assert session.records[0] is session.records[0]
 
     def test_metadata_property_returns_copy(self, sample_records):
         """Test that metadata property returns a copy."""
@@ -206,6 +207,26 @@ class TestLogSession:
         for record in filtered.records:
             assert record["senderTag"] == "Head"
 
+    def test_filter_multiple_conditions(self, sample_records):
+        """Test combining several conditions in a single filter pass."""
+        session = LogSession(sample_records)
+
+        filtered = session.filter(
+            lambda r: r.get("myType") == "AbsoluteActivityRecord",
+            lambda r: r.get("senderTag") == "Head",
+        )
+
+        assert len(filtered) == 3
+        for record in filtered.records:
+            assert record["senderTag"] == "Head"
+
+    def test_filter_requires_condition(self, sample_records):
+        """Test that filter() without conditions is rejected."""
+        session = LogSession(sample_records)
+
+        with pytest.raises(TypeError):
+            session.filter()
+
     def test_filter_type(self, sample_records):
         """Test filtering by record type."""
         session = LogSession(sample_records)
@@ -224,6 +245,46 @@ class TestLogSession:
 
         assert len(filtered) == 8  # 6 movement + 2 scene records = 8
 
+    def test_count(self, sample_records):
+        """Test counting records without materializing a session."""
+        session = LogSession(sample_records)
+
+        assert session.count() == 9
+        assert session.count(lambda r: r.get("senderTag") == "Head") == 3
+        assert (
+            session.count(
+                lambda r: r.get("myType") == "AbsoluteActivityRecord",
+                lambda r: r.get("senderTag") == "Head",
+            )
+            == 3
+        )
+
+    def test_count_type(self, sample_records):
+        """Test counting records by type via the index."""
+        session = LogSession(sample_records)
+
+        assert session.count_type("AbsoluteActivityRecord") == 6
+        assert session.count_type("AbsoluteActivityRecord", "SceneEntryRecord") == 8
+        assert session.count_type("NonExistentRecord") == 0
+
+    def test_filter_sender(self, sample_records):
+        """Test filtering by sender tag."""
+        session = LogSession(sample_records)
+
+        head_session = session.filter_sender("Head")
+
+        assert len(head_session) == 3  # 3 head records in sample data
+        for record in head_session.records:
+            assert record["senderTag"] == "Head"
+
+    def test_filter_sender_multiple(self, sample_records):
+        """Test filtering by multiple sender tags."""
+        session = LogSession(sample_records)
+
+        filtered = session.filter_sender("LeftHand", "RightHand")
+
+        assert len(filtered) == 3  # 2 left hand + 1 right hand records = 3
+
     def test_filter_time_range(self, sample_records):
         """Test filtering by time range."""
         session = LogSession(sample_records)
@@ -276,6 +337,24 @@ class TestLogSession:
         assert stats["millis_since_epoch_range"]["start"] == 1000
         assert stats["millis_since_epoch_range"]["end"] == 25000
 
+    def test_stats_with_matches_filtered_stats(self, sample_records):
+        """Test streaming stats match filter().get_stats()."""
+        session = LogSession(sample_records)
+
+        streamed = session.stats_with(lambda r: r.get("myType") == "SceneEntryRecord")
+        materialized = session.filter(
+            lambda r: r.get("myType") == "SceneEntryRecord"
+        ).get_stats()
+
+        assert streamed == materialized
+
+    def test_stats_with_requires_condition(self, sample_records):
+        """Test that stats_with raises without any condition."""
+        session = LogSession(sample_records)
+
+        with pytest.raises(TypeError):
+            session.stats_with()
+
     def test_to_pandas_basic(self, sample_records):
         """Test pandas DataFrame export."""
         session = LogSession(sample_records)
@@ -425,6 +504,18 @@ class TestSceneView:
         assert filtered.info.name == "Test"
         assert len(filtered) == 6
 
+    def test_filter_sender_returns_scene_view(self, sample_records):
+        """Test that filter_sender returns a SceneView."""
+        session = LogSession(sample_records)
+        scene_info = SceneInfo("Test", 0, 1.0, 10.0, 1000, 10000)
+        scene_view = SceneView(session, scene_info)
+
+        filtered = scene_view.filter_sender("Head")
+
+        assert isinstance(filtered, SceneView)
+        assert filtered.info.name == "Test"
+        assert len(filtered) == 3
+
     def test_filter_time_range_returns_scene_view(self, sample_records):
         """Test that filter_time_range returns a SceneView."""
         session = LogSession(sample_records)
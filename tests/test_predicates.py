@@ -0,0 +1,39 @@
+"""
+Tests for the predicates module.
+"""
+
+from bwell_logkit.logs import LogSession
+from bwell_logkit.predicates import Eq
+
+
+class TestEq:
+    """Test the Eq predicate."""
+
+    def test_eq_matches(self):
+        """Test matching and non-matching records."""
+        pred = Eq("senderTag", "Head")
+
+        assert pred({"senderTag": "Head"}) is True
+        assert pred({"senderTag": "LeftHand"}) is False
+
+    def test_eq_missing_field(self):
+        """Test that records missing the field do not match."""
+        pred = Eq("senderTag", "Head")
+        assert pred({"myType": "GameSettingsRecord"}) is False
+
+    def test_eq_repr(self):
+        """Test the repr output."""
+        assert repr(Eq("senderTag", "Head")) == "Eq('senderTag', 'Head')"
+
+    def test_eq_with_filter(self, sample_records):
+        """Test using Eq predicates with LogSession.filter."""
+        session = LogSession(sample_records)
+
+        filtered = session.filter(
+            Eq("myType", "AbsoluteActivityRecord"),
+            Eq("senderTag", "Head"),
+        )
+
+        assert len(filtered) == 3
+        for record in filtered.records:
+            assert record["senderTag"] == "Head"
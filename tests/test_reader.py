@@ -2,6 +2,7 @@
 Tests for the reader module.
 """
 
+import os
 from pathlib import Path
 
 import orjson
@@ -79,6 +80,34 @@ class TestReadRecords:
         records = read_records(sample_log_file, encoding="utf-8")
         assert len(records) == 9
 
+    def test_read_records_cached_until_file_changes(self, tmp_path, sample_log_data):
+        """Test repeated reads are memoized and edits invalidate the cache."""
+        log_file = tmp_path / "cached.json"
+        log_file.write_bytes(orjson.dumps(sample_log_data))
+
+        first = read_records(log_file)
+        second = read_records(log_file)
+
+        # Fresh list each call, but the parsed record dicts are shared
+        assert first is not second
+        assert first[0] is second[0]
+
+        # Rewriting the file yields newly parsed records
+        os.utime(log_file, ns=(0, 0))
+        third = read_records(log_file)
+        assert third[0] is not first[0]
+        assert third == first
+
+    def test_read_ndjson_file(self, tmp_path, sample_records):
+        """Test reading newline-delimited JSON (one record per line)."""
+        ndjson_file = tmp_path / "records.ndjson"
+        ndjson_file.write_bytes(b"\n".join(orjson.dumps(r) for r in sample_records))
+
+        records = read_records(ndjson_file)
+
+        assert len(records) == 9
+        assert records[0]["myType"] == sample_records[0]["myType"]
+
 
 class TestLoadLog:
     """Test cases for load_log function."""
@@ -116,7 +145,7 @@ class TestJsonHealing:
 
     def test_heal_json_trailing_comma_missing_brackets(self):
         """Test healing bWell log with trailing comma and missing ]}."""
-        malformed = '{"data": [{"test": "value"},'
+        malformed = b'{"data": [{"test": "value"},'
         healed = _heal_json(malformed)
 
         result = orjson.loads(healed)
@@ -124,7 +153,7 @@ class TestJsonHealing:
 
     def test_heal_json_missing_closing_bracket_only(self):
         """Test healing bWell log with missing } only."""
-        malformed = '{"data": [{"test": "value"}]'
+        malformed = b'{"data": [{"test": "value"}]'
         healed = _heal_json(malformed)
 
         result = orjson.loads(healed)
@@ -132,7 +161,7 @@ class TestJsonHealing:
 
     def test_heal_json_already_valid(self):
         """Test healing already valid JSON doesn't break it."""
-        valid = '{"data": [{"test": "value"}]}'
+        valid = b'{"data": [{"test": "value"}]}'
         healed = _heal_json(valid)
 
         result = orjson.loads(healed)
@@ -140,7 +169,7 @@ class TestJsonHealing:
 
     def test_heal_json_strip_whitespace(self):
         """Test that healing strips whitespace."""
-        malformed = '  {"data": [{"test": "value"}]  '
+        malformed = b'  {"data": [{"test": "value"}]  '
         healed = _heal_json(malformed)
 
         result = orjson.loads(healed)
@@ -215,13 +244,9 @@ class TestLoadAllLogs:
         control_dir.mkdir()
 
         # Create log files in different directories
-        (base_dir / "session_1.json").write_text(orjson.dumps(sample_log_data).decode())
-        (adhd_dir / "participant_01.json").write_text(
-            orjson.dumps(sample_log_data).decode()
-        )
-        (control_dir / "participant_02.json").write_text(
-            orjson.dumps(sample_log_data).decode()
-        )
+        (base_dir / "session_1.json").write_bytes(orjson.dumps(sample_log_data))
+        (adhd_dir / "participant_01.json").write_bytes(orjson.dumps(sample_log_data))
+        (control_dir / "participant_02.json").write_bytes(orjson.dumps(sample_log_data))
 
         sessions = load_all_logs(base_dir)
 
@@ -243,8 +268,8 @@ class TestLoadAllLogs:
         log_dir.mkdir()
 
         # Create files with different extensions
-        (log_dir / "log1.json").write_text(orjson.dumps(sample_log_data).decode())
-        (log_dir / "log2.bwell").write_text(orjson.dumps(sample_log_data).decode())
+        (log_dir / "log1.json").write_bytes(orjson.dumps(sample_log_data))
+        (log_dir / "log2.bwell").write_bytes(orjson.dumps(sample_log_data))
         (log_dir / "log3.txt").write_text("not a log file")
 
         # Test default pattern (*.json)
@@ -292,7 +317,7 @@ class TestLoadAllLogs:
         log_dir.mkdir()
 
         # Create valid and invalid log files
-        (log_dir / "valid.json").write_text(orjson.dumps(sample_log_data).decode())
+        (log_dir / "valid.json").write_bytes(orjson.dumps(sample_log_data))
         (log_dir / "invalid.json").write_text("invalid json content")
         (log_dir / "empty.json").write_text("")
 
@@ -309,7 +334,7 @@ class TestLoadAllLogs:
         log_dir.mkdir()
 
         # Create valid and invalid log files
-        (log_dir / "valid.json").write_text(orjson.dumps(sample_log_data).decode())
+        (log_dir / "valid.json").write_bytes(orjson.dumps(sample_log_data))
         (log_dir / "invalid.json").write_text("invalid json content")
 
         # Should raise error on first invalid file
@@ -324,7 +349,7 @@ class TestLoadAllLogs:
         log_dir.mkdir()
 
         log_file = log_dir / "test.json"
-        log_file.write_text(orjson.dumps(sample_log_data).decode())
+        log_file.write_bytes(orjson.dumps(sample_log_data))
 
         # Test encoding parameter is passed through
         sessions = load_all_logs(log_dir, encoding="utf-8")
@@ -348,6 +373,25 @@ class TestLoadAllLogs:
             == set(sessions_single.keys())
         )
 
+    def test_load_all_logs_process_executor(self, log_directory):
+        """Test loading with a process-based executor."""
+        sessions_thread = load_all_logs(log_directory)
+        sessions_process = load_all_logs(
+            log_directory, executor="process", max_workers=2
+        )
+
+        assert sessions_process.keys() == sessions_thread.keys()
+        for relative_path, session in sessions_process.items():
+            assert isinstance(session, LogSession)
+            assert len(session) == len(sessions_thread[relative_path])
+
+    def test_load_all_logs_invalid_executor(self, log_directory):
+        """Test that an unknown executor name is rejected."""
+        with pytest.raises(ValueError) as exc_info:
+            load_all_logs(log_directory, executor="greenlet")
+
+        assert "executor" in str(exc_info.value)
+
     def test_load_all_logs_metadata_preservation(self, log_directory):
         """Test that original metadata is preserved and new metadata is
         added."""
@@ -377,7 +421,7 @@ class TestLoadAllLogs:
             data = sample_log_data.copy()
             for record in data["data"]:
                 record["timestamp"] = record["timestamp"] + i
-            log_file.write_text(orjson.dumps(data).decode())
+            log_file.write_bytes(orjson.dumps(data))
 
         sessions = load_all_logs(log_dir)
 
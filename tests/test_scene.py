@@ -156,6 +156,16 @@ class TestSceneManager:
         assert "end_game_time_secs" in instance
         assert "duration_secs" in instance
 
+    def test_get_scene_summary_without_instances(self, sample_records):
+        """Test scene summary with instance details skipped."""
+        manager = SceneManager(sample_records)
+        summary = manager.get_scene_summary(include_instances=False)
+
+        main_menu_summary = summary["MainMenu"]
+        assert main_menu_summary["instance_count"] == 1
+        assert main_menu_summary["total_duration_secs"] > 0
+        assert "instances" not in main_menu_summary
+
 
 class TestSceneManagerEdgeCases:
     """Test edge cases and special scenarios."""